@@ -1,11 +1,13 @@
 """Main entry point for the porter CLI."""
 
 import sys
-from porter.app import PorterApp
 
 
 def main():
     """Run the Porter TUI application."""
+    # Imported here so the Textual stack only loads when the app actually starts
+    from porter.app import PorterApp
+
     app = PorterApp()
     app.run()
 
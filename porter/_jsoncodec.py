@@ -0,0 +1,30 @@
+"""Shared JSON codec for Porter, backed by orjson."""
+
+import json
+from typing import Any
+
+import orjson
+
+# orjson's error subclasses the stdlib one, so this catches failures from both parsers
+JSONDecodeError = json.JSONDecodeError
+loads = orjson.loads
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON."""
+    return orjson.dumps(obj)
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 JSON indented by two spaces."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
+def reindent(text: str | bytes) -> str:
+    """
+    Re-indent JSON text by two spaces.
+
+    This goes through the stdlib parser because orjson turns integers wider
+    than 64 bits into floats, which would alter text the user sees or sends.
+    """
+    return json.dumps(json.loads(text), indent=2)
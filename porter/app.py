@@ -1,19 +1,37 @@
 """Main Textual application for Porter."""
 
-import json
+import asyncio
 from pathlib import Path
 
 from textual.app import App, ComposeResult
-from textual.containers import Horizontal as HorizontalContainer
+from textual.containers import Horizontal as HorizontalContainer, Vertical
 from textual.reactive import reactive
-from textual.widgets import Button, Header, Footer, Input, Label, Select, TextArea
-
-from porter import collections
-from porter.http_client import send_request, validate_url
-from porter.widgets import HeaderRow, RequestEditor, ResponseViewer
 from textual.screen import ModalScreen
-from textual.containers import Vertical, Grid
-from textual.widgets import Static
+from textual.timer import Timer
+from textual.widgets import Button, Header, Footer, Input, Label, Select, Static, TextArea
+
+from porter import _jsoncodec, collections
+from porter.http_client import aclose_all, send_request, validate_url
+from porter.widgets import HeaderRow, HeadersEditor, RequestEditor, ResponseViewer
+
+
+# Delay before a request name edit is reflected in the subtitle
+SUBTITLE_DEBOUNCE_SECONDS = 0.15
+
+# Bodies larger than this are formatted in a worker thread to keep the UI responsive
+FORMAT_IN_THREAD_THRESHOLD = 1024 * 1024
+
+
+def _set_text(area: TextArea, text: str) -> None:
+    """Set a TextArea's text, skipping the re-render if it is unchanged."""
+    if area.text != text:
+        area.text = text
+
+
+def _set_value(widget: Input | Select, value: str) -> None:
+    """Set an Input or Select value, skipping the update if it is unchanged."""
+    if widget.value != value:
+        widget.value = value
 
 
 class CollectionSelectorScreen(ModalScreen[Path | None]):
@@ -81,6 +99,10 @@ class PorterApp(App):
     # Track the current collection
     current_collection_path: reactive[Path] = reactive(collections.DEFAULT_COLLECTION)
 
+    # Debounced subtitle update for request name edits
+    _pending_name: str = "Untitled Request"
+    _name_timer: Timer | None = None
+
     CSS = """
     Screen {
         background: $background;
@@ -135,19 +157,10 @@ class PorterApp(App):
     #headers-container {
         height: 1fr;
         border: solid $primary;
-    }
-
-    HeaderRow {
-        height: 3;
-        width: 100%;
-    }
-
-    .header-key {
-        width: 1fr;
-    }
-
-    .header-value {
-        width: 2fr;
+        layout: grid;
+        grid-size: 2;
+        grid-columns: 1fr 2fr;
+        grid-rows: 3;
     }
 
     #headers-buttons {
@@ -207,15 +220,35 @@ class PorterApp(App):
             yield ResponseViewer()
         yield Footer()
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Load saved request on app startup."""
+        # Cache handles to widgets that are read or updated repeatedly
+        self._name_input = self.query_one("#request-name", Input)
+        self._method_select = self.query_one("#method-select", Select)
+        self._url_input = self.query_one("#url-input", Input)
+        self._body_area = self.query_one("#body-text", TextArea)
+        self._headers_container = self.query_one("#headers-container")
+        self._response_label = self.query_one("#response-label", Label)
+        self._resp_body = self.query_one("#response-body", TextArea)
+        self._resp_headers = self.query_one("#response-headers", TextArea)
+        self._resp_raw = self.query_one("#response-raw", TextArea)
+        self._header_rows: list[HeaderRow] = [self.query_one(HeadersEditor).initial_row]
+        self._request_editor = self.query_one(RequestEditor)
+
+        # Body text produced by the last successful format
+        self._last_formatted_text: str | None = None
+
         # Update collection label
         self._update_collection_label()
 
         # Load saved request from current collection
         saved_request = collections.load_request(self.current_collection_path)
         if saved_request:
-            self._load_request_into_ui(saved_request)
+            await self._load_request_into_ui(saved_request)
+
+    async def on_unmount(self) -> None:
+        """Close pooled HTTP connections on shutdown."""
+        await aclose_all()
 
     def watch_current_collection_path(self, new_path: Path) -> None:
         """Update the UI when the collection changes."""
@@ -227,47 +260,31 @@ class PorterApp(App):
         label = self.query_one("#collection-label", Label)
         label.update(f"Collection: {collection_name}")
 
-    def _load_request_into_ui(self, request: collections.Request) -> None:
+    async def _load_request_into_ui(self, request: collections.Request) -> None:
         """Populate the UI with a saved request."""
         # Set name
-        name_input = self.query_one("#request-name", Input)
-        name_input.value = request.name
+        _set_value(self._name_input, request.name)
         self.sub_title = request.name
 
         # Set method
-        method_select = self.query_one("#method-select", Select)
-        method_select.value = request.method
+        _set_value(self._method_select, request.method)
 
         # Set URL
-        url_input = self.query_one("#url-input", Input)
-        url_input.value = request.url
+        _set_value(self._url_input, request.url)
 
         # Set body
-        body_area = self.query_one("#body-text", TextArea)
-        body_area.text = request.body
-
-        # Set headers - clear existing rows first, then add new ones
-        container = self.query_one("#headers-container")
-        # Remove all existing header rows
-        for row in container.query(HeaderRow):
-            row.remove()
-
-        # Add header rows for saved headers
-        if request.headers:
-            for key, value in request.headers.items():
-                row = HeaderRow(key=key, value=value)
-                container.mount(row)
-        else:
-            # Add one empty row if no headers
-            container.mount(HeaderRow())
+        _set_text(self._body_area, request.body)
+
+        # Set headers, with one empty row if there are none
+        await self._replace_header_rows(request.headers or {"": ""})
 
     def _get_current_request(self) -> collections.Request:
         """Get the current request state from the UI."""
-        name = self.query_one("#request-name", Input).value
-        method = self.query_one("#method-select", Select).value
-        url = self.query_one("#url-input", Input).value
+        name = self._name_input.value
+        method = self._method_select.value
+        url = self._url_input.value
         headers = self._get_headers_from_ui()
-        body = self.query_one("#body-text", TextArea).text
+        body = self._body_area.text
 
         return collections.Request(
             name=name,
@@ -277,37 +294,37 @@ class PorterApp(App):
             body=body,
         )
 
-    def action_quit(self) -> None:
+    async def action_quit(self) -> None:
         """Save current request and quit the application."""
-        # Save current request before exiting
+        # Save current request before exiting, off the event loop
         current_request = self._get_current_request()
-        collections.save_request(current_request, self.current_collection_path)
+        await asyncio.to_thread(
+            collections.save_request, current_request, self.current_collection_path
+        )
         self.exit()
 
     async def action_send_request(self) -> None:
         """Send the HTTP request."""
         # Gather request data from UI
-        method = self.query_one("#method-select", Select).value
-        url_input = self.query_one("#url-input", Input)
-        url = url_input.value.strip()
+        method = self._method_select.value
+        url = self._url_input.value.strip()
 
         # Validate URL
         is_valid, error_msg = validate_url(url)
         if not is_valid:
             self._display_error(error_msg)
-            url_input.focus()
+            self._url_input.focus()
             return
 
         # Gather headers
         headers = self._get_headers_from_ui()
 
         # Get body
-        body_text = self.query_one("#body-text", TextArea).text.strip()
+        body_text = self._body_area.text.strip()
         body = body_text if body_text else None
 
         # Update response label to show loading
-        response_label = self.query_one("#response-label", Label)
-        response_label.update("Response - Loading...")
+        self._response_label.update("Response - Loading...")
 
         # Send the request
         response = await send_request(
@@ -322,36 +339,45 @@ class PorterApp(App):
         # Display the response
         self._display_response(response)
 
-    def action_format_json(self) -> None:
+    async def action_format_json(self) -> None:
         """Format the JSON in the request body editor."""
-        body_area = self.query_one("#body-text", TextArea)
+        body_area = self._body_area
         body_text = body_area.text.strip()
 
         if not body_text:
             self.notify("Body is empty", severity="warning")
             return
 
+        # Skip the round trip if the body is unchanged since the last format
+        if body_text == self._last_formatted_text:
+            self.notify("JSON is already formatted", severity="information")
+            return
+
         try:
             # Parse and re-format the JSON
-            parsed = json.loads(body_text)
-            formatted = json.dumps(parsed, indent=2)
-            body_area.text = formatted
-            self.notify("JSON formatted successfully", severity="information")
-        except json.JSONDecodeError as e:
+            if len(body_text) > FORMAT_IN_THREAD_THRESHOLD:
+                formatted = await asyncio.to_thread(_jsoncodec.reindent, body_text)
+            else:
+                formatted = _jsoncodec.reindent(body_text)
+        except _jsoncodec.JSONDecodeError as e:
             self.notify(f"Invalid JSON: {str(e)}", severity="error")
+            return
+
+        body_area.text = formatted
+        self._last_formatted_text = formatted
+        self.notify("JSON formatted successfully", severity="information")
 
     def action_clear_body(self) -> None:
         """Clear the request body editor."""
-        body_area = self.query_one("#body-text", TextArea)
-        body_area.text = ""
-        body_area.focus()
+        self._body_area.text = ""
+        self._body_area.focus()
         self.notify("Body cleared", severity="information")
 
     def action_open_collection(self) -> None:
         """Open the collection selector modal."""
         self.push_screen(CollectionSelectorScreen(), self._handle_collection_selection)
 
-    def _handle_collection_selection(self, selected_path: Path | None) -> None:
+    async def _handle_collection_selection(self, selected_path: Path | None) -> None:
         """Handle collection selection from modal."""
         if selected_path is None:
             return
@@ -366,10 +392,10 @@ class PorterApp(App):
         # Load request from new collection
         saved_request = collections.load_request(self.current_collection_path)
         if saved_request:
-            self._load_request_into_ui(saved_request)
+            await self._load_request_into_ui(saved_request)
         else:
             # Clear UI if collection is empty
-            self._clear_request_ui()
+            await self._clear_request_ui()
 
         self.notify(f"Switched to collection: {collections.get_collection_name(selected_path)}")
 
@@ -377,7 +403,7 @@ class PorterApp(App):
         """Open the new collection modal."""
         self.push_screen(NewCollectionScreen(), self._handle_new_collection)
 
-    def _handle_new_collection(self, collection_name: str | None) -> None:
+    async def _handle_new_collection(self, collection_name: str | None) -> None:
         """Handle new collection creation."""
         if collection_name is None or not collection_name.strip():
             return
@@ -393,131 +419,130 @@ class PorterApp(App):
         self.current_collection_path = new_path
 
         # Clear UI for new empty collection
-        self._clear_request_ui()
+        await self._clear_request_ui()
 
         self.notify(f"Created collection: {collections.get_collection_name(new_path)}")
 
-    def _clear_request_ui(self) -> None:
+    async def _clear_request_ui(self) -> None:
         """Clear all request fields in the UI."""
         # Reset name
-        name_input = self.query_one("#request-name", Input)
-        name_input.value = "Untitled Request"
+        self._name_input.value = "Untitled Request"
         self.sub_title = "Untitled Request"
 
         # Reset method
-        method_select = self.query_one("#method-select", Select)
-        method_select.value = "GET"
+        self._method_select.value = "GET"
 
         # Reset URL
-        url_input = self.query_one("#url-input", Input)
-        url_input.value = ""
+        self._url_input.value = ""
 
         # Reset body
-        body_area = self.query_one("#body-text", TextArea)
-        body_area.text = ""
+        self._body_area.text = ""
 
         # Reset headers - clear all and add one empty row
-        container = self.query_one("#headers-container")
-        for row in container.query(HeaderRow):
-            row.remove()
-        container.mount(HeaderRow())
+        await self._replace_header_rows({"": ""})
 
     def _get_headers_from_ui(self) -> dict[str, str]:
         """Extract headers from the UI."""
-        headers = {}
-        container = self.query_one("#headers-container")
-        for row in container.query(HeaderRow):
-            inputs = row.query(Input)
-            if len(inputs) == 2:
-                key_input, value_input = inputs
-                key = key_input.value.strip()
-                value = value_input.value.strip()
-                if key:  # Only add non-empty keys
-                    headers[key] = value
-        return headers
+        # Only include rows with a non-empty key
+        return {
+            key: row.value_input.value.strip()
+            for row in self._header_rows
+            if (key := row.key_input.value.strip())
+        }
 
     def _display_response(self, response) -> None:
         """Display the HTTP response in the response viewer."""
-        # Update response label with status and time
-        response_label = self.query_one("#response-label", Label)
         if response.error:
-            response_label.update(f"Response - Error ({response.duration_ms}ms)")
-        else:
-            response_label.update(f"Response - {response.status_text} ({response.duration_ms}ms)")
+            self._response_label.update(f"Response - Error ({response.duration_ms}ms)")
+            _set_text(self._resp_body, response.error)
+            _set_text(self._resp_headers, "")
+            _set_text(
+                self._resp_raw,
+                f"Error: {response.error}\nDuration: {response.duration_ms}ms",
+            )
+            return
 
-        # Display body
-        body_area = self.query_one("#response-body", TextArea)
-        if response.error:
-            body_area.text = response.error
-        else:
-            # Try to pretty-print JSON
-            try:
-                parsed = json.loads(response.body)
-                body_area.text = json.dumps(parsed, indent=2)
-            except (json.JSONDecodeError, ValueError):
-                # Not JSON, display as-is
-                body_area.text = response.body
+        # Join the headers once; both the Headers and Raw tabs show them
+        headers_text = "\n".join(
+            f"{key}: {value}" for key, value in response.header_items()
+        )
+
+        # Update response label with status and time
+        self._response_label.update(f"Response - {response.status_text} ({response.duration_ms}ms)")
+
+        # Display body, using the pretty-printed JSON when the client produced one
+        body_text = response.body if response.pretty_body is None else response.pretty_body
+        _set_text(self._resp_body, body_text)
 
         # Display headers
-        headers_area = self.query_one("#response-headers", TextArea)
-        if response.error:
-            headers_area.text = ""
-        else:
-            headers_text = "\n".join(
-                f"{key}: {value}" for key, value in response.headers.items()
-            )
-            headers_area.text = headers_text
+        _set_text(self._resp_headers, headers_text)
 
         # Display raw response
-        raw_area = self.query_one("#response-raw", TextArea)
-        if response.error:
-            raw_area.text = f"Error: {response.error}\nDuration: {response.duration_ms}ms"
-        else:
-            raw_text = f"{response.status_text}\n"
-            raw_text += f"Duration: {response.duration_ms}ms\n\n"
-            raw_text += "Headers:\n"
-            raw_text += "\n".join(
-                f"{key}: {value}" for key, value in response.headers.items()
-            )
-            raw_text += "\n\nBody:\n"
-            raw_text += response.body
-            raw_area.text = raw_text
+        _set_text(
+            self._resp_raw,
+            f"{response.status_text}\n"
+            f"Duration: {response.duration_ms}ms\n\n"
+            f"Headers:\n{headers_text}\n\n"
+            f"Body:\n{response.body}",
+        )
 
     def _display_error(self, error: str) -> None:
         """Display an error message in the response viewer."""
-        response_label = self.query_one("#response-label", Label)
-        response_label.update(f"Response - Error")
+        self._response_label.update(f"Response - Error")
 
         # Show error in all tabs
-        for area_id in ["#response-body", "#response-headers", "#response-raw"]:
-            area = self.query_one(area_id, TextArea)
-            area.text = error
+        for area in (self._resp_body, self._resp_headers, self._resp_raw):
+            _set_text(area, error)
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "add-header-button":
-            self._add_header_row()
+            await self._add_header_row()
         elif event.button.id == "remove-header-button":
-            self._remove_header_row()
+            await self._remove_header_row()
         elif event.button.id == "send-button":
-            self.action_send_request()
+            await self.action_send_request()
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle input changes."""
         if event.input.id == "request-name":
-            # Update subtitle to show the request name
+            # Update subtitle to show the request name once typing pauses
             name = event.value.strip()
-            self.sub_title = name if name else "Untitled Request"
+            self._pending_name = name if name else "Untitled Request"
+            if self._name_timer is None:
+                self._name_timer = self.set_timer(SUBTITLE_DEBOUNCE_SECONDS, self._commit_name)
 
-    def _add_header_row(self) -> None:
+    def _commit_name(self) -> None:
+        """Apply the pending request name to the subtitle."""
+        self._name_timer = None
+        self.sub_title = self._pending_name
+
+    async def _add_header_row(self, key: str = "", value: str = "") -> None:
         """Add a new header row to the headers container."""
-        container = self.query_one("#headers-container")
-        new_row = HeaderRow()
-        container.mount(new_row)
+        new_row = HeaderRow(key=key, value=value)
+        self._header_rows.append(new_row)
+        await self._headers_container.mount(*new_row.widgets)
+        self._request_editor.invalidate_navigation()
 
-    def _remove_header_row(self) -> None:
+    async def _remove_header_row(self) -> None:
         """Remove the last header row from the headers container."""
-        container = self.query_one("#headers-container")
-        rows = container.query(HeaderRow)
-        if len(rows) > 0:
-            rows.last().remove()
+        if self._header_rows:
+            await self._header_rows.pop().remove()
+            self._request_editor.invalidate_navigation()
+
+    async def _replace_header_rows(self, headers: dict[str, str]) -> None:
+        """Replace all header rows with one row per given header."""
+        new_rows = [HeaderRow(key=key, value=value) for key, value in headers.items()]
+        old_rows = self._header_rows
+        self._header_rows = new_rows
+
+        # Mount the new rows in one batch before removing the old ones,
+        # so the container never lays out an empty intermediate state
+        await self._headers_container.mount_all(
+            [widget for row in new_rows for widget in row.widgets]
+        )
+        await self._headers_container.remove_children(
+            [widget for row in old_rows for widget in row.widgets]
+        )
+        # Only drop the focus order once the DOM reflects the new rows
+        self._request_editor.invalidate_navigation()
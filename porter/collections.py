@@ -1,31 +1,43 @@
 """Collections management for saving and loading HTTP requests."""
 
-import json
+import os
+import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from porter import _jsoncodec
+
 
 # Default storage location
 PORTER_DIR = Path.home() / ".porter"
 DEFAULT_COLLECTION = PORTER_DIR / "default.json"
 
+# Defaults for scalar Request fields missing from saved data
+_REQUEST_DEFAULTS = {
+    "name": "Untitled Request",
+    "method": "GET",
+    "url": "",
+    "body": "",
+}
+
+# Set once PORTER_DIR is known to exist, so later calls skip the mkdir syscall
+_dir_ready = False
+
 
+@dataclass(slots=True)
 class Request:
     """Represents an HTTP request that can be saved/loaded."""
 
-    def __init__(
-        self,
-        method: str = "GET",
-        url: str = "",
-        headers: dict[str, str] | None = None,
-        body: str = "",
-        name: str = "Untitled Request",
-    ):
-        self.method = method
-        self.url = url
-        self.headers = headers or {}
-        self.body = body
-        self.name = name
+    method: str = "GET"
+    url: str = ""
+    headers: dict[str, str] = field(default_factory=dict)
+    body: str = ""
+    name: str = "Untitled Request"
+
+    def __post_init__(self) -> None:
+        """Treat headers=None as no headers."""
+        self.headers = self.headers or {}
 
     def to_dict(self) -> dict:
         """Convert request to dictionary for JSON serialization."""
@@ -41,26 +53,64 @@ class Request:
     def from_dict(cls, data: dict) -> "Request":
         """Create a Request from a dictionary."""
         return cls(
-            name=data.get("name", "Untitled Request"),
-            method=data.get("method", "GET"),
-            url=data.get("url", ""),
-            headers=data.get("headers", {}),
-            body=data.get("body", ""),
+            headers=data.get("headers") or {},
+            **{key: data.get(key, default) for key, default in _REQUEST_DEFAULTS.items()},
         )
 
 
 def ensure_porter_dir() -> None:
     """Create ~/.porter/ directory if it doesn't exist."""
+    global _dir_ready
+    if _dir_ready:
+        return
     PORTER_DIR.mkdir(parents=True, exist_ok=True)
+    _dir_ready = True
+
 
+def _write_collection(collection_path: Path, data: dict, pretty: bool = False) -> None:
+    """
+    Atomically write collection data to disk.
 
-def save_request(request: Request, collection_path: Path = DEFAULT_COLLECTION) -> None:
+    The data is written and fsynced to a temporary file next to the
+    collection, then renamed over it, so a crash mid-write never leaves a
+    truncated file. The temporary file is removed if anything fails.
+
+    Args:
+        collection_path: Path to the collection file
+        data: Collection data to serialize
+        pretty: Whether to indent the JSON for human readers
+    """
+    raw = _jsoncodec.dumps_pretty(data) if pretty else _jsoncodec.dumps_compact(data)
+    tmp_file = tempfile.NamedTemporaryFile(
+        dir=collection_path.parent,
+        prefix=f"{collection_path.name}.",
+        suffix=".tmp",
+        delete=False,
+    )
+    tmp_path = Path(tmp_file.name)
+    try:
+        with tmp_file:
+            tmp_file.write(raw)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, collection_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def save_request(
+    request: Request,
+    collection_path: Path = DEFAULT_COLLECTION,
+    pretty: bool = False,
+) -> None:
     """
     Save a request to a collection file.
 
     Args:
         request: The Request object to save
         collection_path: Path to the collection file (defaults to default.json)
+        pretty: Whether to indent the JSON (useful for exporting)
     """
     ensure_porter_dir()
 
@@ -71,8 +121,7 @@ def save_request(request: Request, collection_path: Path = DEFAULT_COLLECTION) -
         "requests": [request.to_dict()],
     }
 
-    with open(collection_path, "w") as f:
-        json.dump(data, f, indent=2)
+    _write_collection(collection_path, data, pretty=pretty)
 
 
 def load_request(collection_path: Path = DEFAULT_COLLECTION) -> Optional[Request]:
@@ -89,8 +138,7 @@ def load_request(collection_path: Path = DEFAULT_COLLECTION) -> Optional[Request
         return None
 
     try:
-        with open(collection_path, "r") as f:
-            data = json.load(f)
+        data = _jsoncodec.loads(collection_path.read_bytes())
 
         requests = data.get("requests", [])
         if not requests:
@@ -99,7 +147,7 @@ def load_request(collection_path: Path = DEFAULT_COLLECTION) -> Optional[Request
         # Return the first (and currently only) request
         return Request.from_dict(requests[0])
 
-    except (json.JSONDecodeError, KeyError, IOError):
+    except (_jsoncodec.JSONDecodeError, KeyError, OSError):
         # If the file is corrupted or invalid, return None
         return None
 
@@ -114,8 +162,13 @@ def list_collections() -> list[Path]:
     ensure_porter_dir()
 
     # Find all .json files in the porter directory
-    collections = sorted(PORTER_DIR.glob("*.json"))
-    return collections
+    with os.scandir(PORTER_DIR) as entries:
+        names = [
+            entry.name for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
+    names.sort()
+    return [PORTER_DIR / name for name in names]
 
 
 def create_collection(name: str) -> Path:
@@ -143,8 +196,7 @@ def create_collection(name: str) -> Path:
         "requests": [],
     }
 
-    with open(collection_path, "w") as f:
-        json.dump(data, f, indent=2)
+    _write_collection(collection_path, data)
 
     return collection_path
 
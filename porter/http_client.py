@@ -1,10 +1,46 @@
 """HTTP client for making requests."""
 
-import json
+import asyncio
+import functools
+import re
 import time
-from typing import Any, Dict, Optional
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
 
-import httpx
+from porter import _jsoncodec
+
+if TYPE_CHECKING:
+    import httpx
+
+
+# Reason phrases for every standard status code
+_STATUS_PHRASES: Dict[int, str] = {status.value: status.phrase for status in HTTPStatus}
+
+# An http(s) URL with no whitespace anywhere after the scheme
+_URL_RE = re.compile(r"https?://\S*")
+
+# Matches bodies whose first non-whitespace byte opens a JSON object or array
+_JSON_START_RE = re.compile(rb"\s*[\[{]")
+
+# JSON bodies up to this many bytes are pretty-printed for display
+PRETTY_PRINT_MAX_SIZE = 2_000_000
+
+# Response bodies are truncated after this many bytes (5MB)
+MAX_BODY_SIZE = 5 * 1024 * 1024
+
+# Size of the chunks read while streaming a response body
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Shared clients keyed by (verify_ssl, timeout), reused across requests so
+# connections to the same host stay alive (and multiplex over HTTP/2). Each
+# entry also records the event loop its connections belong to.
+_CLIENTS: Dict[tuple[bool, float], tuple[asyncio.AbstractEventLoop, "httpx.AsyncClient"]] = {}
+
+
+def _import_httpx() -> None:
+    """Import httpx on first use, keeping it and its TLS stack off app startup."""
+    global httpx
+    import httpx
 
 
 class HTTPResponse:
@@ -13,41 +49,108 @@ class HTTPResponse:
     def __init__(
         self,
         status_code: int,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
         body: str,
         duration_ms: int,
         error: Optional[str] = None,
+        pretty_body: Optional[str] = None,
     ):
         self.status_code = status_code
         self.headers = headers
         self.body = body
         self.duration_ms = duration_ms
         self.error = error
+        self.pretty_body = pretty_body
+        self._status_text: Optional[str] = None
 
     @property
     def status_text(self) -> str:
         """Get human-readable status text."""
-        status_texts = {
-            200: "OK",
-            201: "Created",
-            204: "No Content",
-            400: "Bad Request",
-            401: "Unauthorized",
-            403: "Forbidden",
-            404: "Not Found",
-            500: "Internal Server Error",
-            502: "Bad Gateway",
-            503: "Service Unavailable",
-        }
-        text = status_texts.get(self.status_code, "")
-        return f"{self.status_code} {text}" if text else str(self.status_code)
+        if self._status_text is None:
+            text = _STATUS_PHRASES.get(self.status_code, "")
+            self._status_text = f"{self.status_code} {text}" if text else str(self.status_code)
+        return self._status_text
+
+    def header_items(self) -> list[tuple[str, str]]:
+        """Get header name/value pairs, keeping repeated headers separate."""
+        multi_items = getattr(self.headers, "multi_items", None)
+        if multi_items is not None:
+            return multi_items()
+        return list(self.headers.items())
+
+
+def get_client(verify_ssl: bool = True, timeout: float = 30.0) -> "httpx.AsyncClient":
+    """
+    Get the shared client for a configuration, creating it on first use.
+
+    Pooled connections only work on the event loop that opened them, so a
+    client created under a different loop (e.g. an earlier asyncio.run())
+    is replaced rather than reused.
+
+    Args:
+        verify_ssl: Whether to verify SSL certificates
+        timeout: Request timeout in seconds
+
+    Returns:
+        A pooled httpx.AsyncClient
+    """
+    key = (verify_ssl, timeout)
+    loop = asyncio.get_running_loop()
+    cached = _CLIENTS.get(key)
+    if cached is not None and cached[0] is loop and not cached[1].is_closed:
+        return cached[1]
+
+    _import_httpx()
+    client = httpx.AsyncClient(
+        verify=verify_ssl,
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=True,
+        follow_redirects=True,
+    )
+    _CLIENTS[key] = (loop, client)
+    return client
+
+
+async def aclose_all() -> None:
+    """Close all shared clients and their pooled connections."""
+    loop = asyncio.get_running_loop()
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client_loop, client in clients:
+        # Clients left over from another event loop can't be closed from this one
+        if client_loop is loop:
+            await client.aclose()
+
+
+def _pretty_print_json(raw: bytes | bytearray, content_type: str) -> Optional[str]:
+    """
+    Pretty-print a JSON response body for display.
+
+    Args:
+        raw: Raw response body bytes
+        content_type: Value of the response Content-Type header
+
+    Returns:
+        Indented JSON text, or None if the body isn't small, valid JSON
+    """
+    if len(raw) > PRETTY_PRINT_MAX_SIZE:
+        return None
+    # Skip the parse for bodies that clearly aren't JSON
+    if "json" not in content_type.lower() and not _JSON_START_RE.match(raw):
+        return None
+    try:
+        return _jsoncodec.reindent(raw)
+    except (ValueError, RecursionError):
+        # Invalid JSON or UTF-8, or nesting too deep for the stdlib parser
+        return None
 
 
 async def send_request(
     method: str,
     url: str,
     headers: Optional[Dict[str, str]] = None,
-    body: Optional[str] = None,
+    body: str | bytes | None = None,
     verify_ssl: bool = True,
     timeout: float = 30.0,
 ) -> HTTPResponse:
@@ -58,71 +161,111 @@ async def send_request(
         method: HTTP method (GET, POST, etc.)
         url: URL to request
         headers: Optional headers dict
-        body: Optional request body
+        body: Optional request body; bytes are sent without re-encoding
         verify_ssl: Whether to verify SSL certificates
         timeout: Request timeout in seconds
 
     Returns:
         HTTPResponse object with response data
     """
-    start_time = time.time()
+    _import_httpx()
+    start_ns = time.perf_counter_ns()
+
+    def elapsed_ms() -> int:
+        """Milliseconds elapsed since the request started."""
+        return (time.perf_counter_ns() - start_ns) // 1_000_000
+
+    def error_response(message: str) -> HTTPResponse:
+        """Build a failed response carrying the elapsed time."""
+        return HTTPResponse(
+            status_code=0,
+            headers={},
+            body="",
+            duration_ms=elapsed_ms(),
+            error=message,
+        )
+
+    # Pass bytes bodies straight through; only text needs encoding
+    content = (body.encode() if isinstance(body, str) else body) or None
+    # Methods from the UI are already upper case, so skip the copy for them
+    method = method if method.isupper() else method.upper()
 
     try:
-        async with httpx.AsyncClient(verify=verify_ssl, timeout=timeout) as client:
-            response = await client.request(
-                method=method.upper(),
-                url=url,
-                headers=headers or {},
-                content=body.encode() if body else None,
-                follow_redirects=True,
-            )
-
-        duration_ms = int((time.time() - start_time) * 1000)
-
-        # Truncate response body if too large (5MB limit)
-        response_body = response.text
-        max_size = 5 * 1024 * 1024  # 5MB
-        if len(response_body) > max_size:
-            response_body = response_body[:max_size] + "\n\n[Response truncated at 5MB]"
+        client = get_client(verify_ssl, timeout)
+        # Stream the body so oversized responses stop downloading at the cap
+        buf = bytearray()
+        total = 0
+        truncated = False
+        async with client.stream(
+            method=method,
+            url=url,
+            headers=headers,
+            content=content,
+        ) as response:
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                total += len(chunk)
+                if total > MAX_BODY_SIZE:
+                    # Keep only the bytes under the cap and cancel the rest of the download
+                    buf.extend(chunk[: len(chunk) - (total - MAX_BODY_SIZE)])
+                    truncated = True
+                    await response.aclose()
+                    break
+                buf.extend(chunk)
+            encoding = response.encoding or "utf-8"
+
+        duration_ms = elapsed_ms()
+
+        # The buffer never exceeds the cap, so decode it as-is (5MB limit)
+        response_body = buf.decode(encoding, errors="replace")
+        if truncated:
+            response_body += "\n\n[Response truncated at 5MB]"
+            pretty_body = None
+        else:
+            pretty_body = _pretty_print_json(buf, response.headers.get("content-type", ""))
 
         return HTTPResponse(
             status_code=response.status_code,
-            headers=dict(response.headers),
+            headers=response.headers,
             body=response_body,
             duration_ms=duration_ms,
+            pretty_body=pretty_body,
         )
 
     except httpx.TimeoutException:
-        duration_ms = int((time.time() - start_time) * 1000)
-        return HTTPResponse(
-            status_code=0,
-            headers={},
-            body="",
-            duration_ms=duration_ms,
-            error=f"Request timeout after {timeout}s",
-        )
+        return error_response(f"Request timeout after {timeout}s")
 
     except httpx.ConnectError as e:
-        duration_ms = int((time.time() - start_time) * 1000)
-        return HTTPResponse(
-            status_code=0,
-            headers={},
-            body="",
-            duration_ms=duration_ms,
-            error=f"Connection error: {str(e)}",
-        )
+        return error_response(f"Connection error: {str(e)}")
 
     except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
-        return HTTPResponse(
-            status_code=0,
-            headers={},
-            body="",
-            duration_ms=duration_ms,
-            error=f"Error: {str(e)}",
-        )
+        return error_response(f"Error: {str(e)}")
+
 
+async def send_batch(
+    requests: list[Dict[str, Any]],
+    max_inflight: int = 10,
+) -> list[HTTPResponse]:
+    """
+    Send several HTTP requests concurrently.
+
+    Args:
+        requests: Keyword arguments for send_request, one dict per request
+        max_inflight: Maximum number of requests in flight at once
 
+    Returns:
+        HTTPResponse objects in the same order as the requests
+    """
+    semaphore = asyncio.Semaphore(max_inflight)
+
+    async def send_one(request: Dict[str, Any]) -> HTTPResponse:
+        """Send one request once a slot is free."""
+        async with semaphore:
+            return await send_request(**request)
+
+    return await asyncio.gather(*(send_one(request) for request in requests))
+
+
+@functools.lru_cache(maxsize=64)
 def validate_url(url: str) -> tuple[bool, Optional[str]]:
     """
     Validate a URL.
@@ -133,16 +276,15 @@ def validate_url(url: str) -> tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not url or not url.strip():
-        return False, "URL cannot be empty"
-
     url = url.strip()
+    if not url:
+        return False, "URL cannot be empty"
 
-    if not (url.startswith("http://") or url.startswith("https://")):
+    if not url.startswith(("http://", "https://")):
         return False, "URL must start with http:// or https://"
 
     # Basic validation - httpx will do more thorough validation
-    if " " in url:
+    if not _URL_RE.fullmatch(url):
         return False, "URL cannot contain spaces"
 
     return True, None
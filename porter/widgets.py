@@ -3,156 +3,105 @@
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.events import Key
+from textual.widget import Widget
 from textual.widgets import Button, Input, Label, Select, Static, TabPane, TabbedContent, TextArea
 
 
-def get_navigable_widgets(screen):
-    """Get all navigable widgets in DOM order."""
-    request_editor = screen.query_one("RequestEditor")
+def find_request_editor(widget: Widget) -> "RequestEditor | None":
+    """Find the RequestEditor containing a widget, if any."""
+    for ancestor in widget.ancestors:
+        if isinstance(ancestor, RequestEditor):
+            return ancestor
+    return None
 
-    # Walk through all descendant widgets in DOM order and filter to navigable types
-    navigable = [
-        widget for widget in request_editor.walk_children()
-        if isinstance(widget, (Select, NavigableInput, NavigableButton, NavigableTextArea))
-    ]
 
-    return navigable
+# Focus movement for each arrow key
+_ARROW_DELTAS = {"up": -1, "down": 1, "left": -1, "right": 1}
 
 
-class NavigableInput(Input):
+class _NavMixin:
+    """Arrow-key focus navigation shared by the navigable widgets."""
+
+    def _focus_sibling(self, delta: int) -> None:
+        """Focus the navigable widget delta positions away from this one."""
+        editor = find_request_editor(self)
+        if editor is None:
+            return
+
+        target = editor.get_navigable_neighbor(self, delta)
+        if target is not None:
+            target.focus()
+
+
+class NavigableInput(_NavMixin, Input):
     """Input widget that supports arrow keys for focus navigation."""
 
     def on_key(self, event: Key) -> None:
         """Handle arrow keys for focus navigation."""
-        if event.key == "up":
-            event.prevent_default()
-            self._focus_previous()
-        elif event.key == "down":
-            event.prevent_default()
-            self._focus_next()
-        elif event.key == "left":
-            # Only navigate if cursor is at the start
-            if self.cursor_position == 0:
-                event.prevent_default()
-                self._focus_previous()
-        elif event.key == "right":
-            # Only navigate if cursor is at the end
-            if self.cursor_position == len(self.value):
-                event.prevent_default()
-                self._focus_next()
-
-    def _focus_previous(self) -> None:
-        """Focus the previous navigable widget."""
-        focusable = get_navigable_widgets(self.screen)
-        if not focusable:
+        key = event.key
+        delta = _ARROW_DELTAS.get(key)
+        if delta is None:
             return
 
-        try:
-            current_index = focusable.index(self)
-            if current_index > 0:
-                focusable[current_index - 1].focus()
-        except (ValueError, IndexError):
-            pass
-
-    def _focus_next(self) -> None:
-        """Focus the next navigable widget."""
-        focusable = get_navigable_widgets(self.screen)
-        if not focusable:
+        # Only navigate left from the start and right from the end
+        if key == "left" and self.cursor_position != 0:
+            return
+        if key == "right" and self.cursor_position != len(self.value):
             return
 
-        try:
-            current_index = focusable.index(self)
-            if current_index < len(focusable) - 1:
-                focusable[current_index + 1].focus()
-        except (ValueError, IndexError):
-            pass
+        event.prevent_default()
+        self._focus_sibling(delta)
 
 
-class NavigableTextArea(TextArea):
+class NavigableTextArea(_NavMixin, TextArea):
     """TextArea widget that supports arrow key navigation at boundaries."""
 
     def on_key(self, event: Key) -> None:
         """Handle arrow keys for focus navigation at boundaries."""
-        if event.key == "up":
-            # Only navigate if cursor is on the first line
-            if self.cursor_location[0] == 0:
-                event.prevent_default()
-                self._focus_previous()
-        elif event.key == "left":
-            # Only navigate if cursor is at the very start
-            if self.cursor_location == (0, 0):
-                event.prevent_default()
-                self._focus_previous()
-
-    def _focus_previous(self) -> None:
-        """Focus the previous navigable widget."""
-        focusable = get_navigable_widgets(self.screen)
-        if not focusable:
+        key = event.key
+        if key != "up" and key != "left":
             return
 
-        try:
-            current_index = focusable.index(self)
-            if current_index > 0:
-                focusable[current_index - 1].focus()
-        except (ValueError, IndexError):
-            pass
+        row, column = self.cursor_location
+        # Up navigates from the first line, left only from the very start
+        if row == 0 and (key == "up" or column == 0):
+            event.prevent_default()
+            self._focus_sibling(-1)
 
 
-class NavigableButton(Button):
+class NavigableButton(_NavMixin, Button):
     """Button widget that supports all arrow keys for focus navigation."""
 
     def on_key(self, event: Key) -> None:
         """Handle arrow keys for focus navigation."""
-        if event.key in ("up", "down", "left", "right"):
-            event.prevent_default()
-            if event.key == "up":
-                self._focus_previous()
-            elif event.key == "down":
-                self._focus_next()
-            elif event.key == "left":
-                self._focus_previous()
-            elif event.key == "right":
-                self._focus_next()
-
-    def _focus_previous(self) -> None:
-        """Focus the previous navigable widget."""
-        focusable = get_navigable_widgets(self.screen)
-        if not focusable:
+        delta = _ARROW_DELTAS.get(event.key)
+        if delta is None:
             return
+        event.prevent_default()
+        self._focus_sibling(delta)
 
-        try:
-            current_index = focusable.index(self)
-            if current_index > 0:
-                focusable[current_index - 1].focus()
-        except (ValueError, IndexError):
-            pass
-
-    def _focus_next(self) -> None:
-        """Focus the next navigable widget."""
-        focusable = get_navigable_widgets(self.screen)
-        if not focusable:
-            return
 
-        try:
-            current_index = focusable.index(self)
-            if current_index < len(focusable) - 1:
-                focusable[current_index + 1].focus()
-        except (ValueError, IndexError):
-            pass
+class HeaderRow:
+    """
+    A single header key-value pair.
 
+    The row is not a widget itself: its two inputs are mounted directly
+    into the headers grid, which saves a wrapper container per header.
+    """
 
-class HeaderRow(Horizontal):
-    """A single header key-value pair row."""
+    def __init__(self, key: str = "", value: str = "") -> None:
+        self.key_input = NavigableInput(placeholder="Header name", value=key, classes="header-key")
+        self.value_input = NavigableInput(placeholder="Header value", value=value, classes="header-value")
 
-    def __init__(self, key: str = "", value: str = "", **kwargs) -> None:
-        super().__init__(**kwargs)
-        self.header_key = key
-        self.header_value = value
+    @property
+    def widgets(self) -> tuple[NavigableInput, NavigableInput]:
+        """The key and value inputs, in display order."""
+        return self.key_input, self.value_input
 
-    def compose(self) -> ComposeResult:
-        """Create key and value inputs."""
-        yield NavigableInput(placeholder="Header name", value=self.header_key, classes="header-key")
-        yield NavigableInput(placeholder="Header value", value=self.header_value, classes="header-value")
+    async def remove(self) -> None:
+        """Remove both inputs from the DOM."""
+        await self.key_input.remove()
+        await self.value_input.remove()
 
 
 class HeadersEditor(Vertical):
@@ -161,9 +110,11 @@ class HeadersEditor(Vertical):
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         yield Label("Headers")
-        # Container for header rows
+        # Grid of header key/value inputs, two columns per row
         with VerticalScroll(id="headers-container"):
-            yield HeaderRow()
+            # Kept so the app can track the starting row without a DOM query
+            self.initial_row = HeaderRow()
+            yield from self.initial_row.widgets
         with Horizontal(id="headers-buttons"):
             yield NavigableButton("Add Header", id="add-header-button", variant="success")
             yield NavigableButton("Remove Last", id="remove-header-button", variant="error")
@@ -211,6 +162,38 @@ class ResponseViewer(Vertical):
 class RequestEditor(Vertical):
     """Widget for editing HTTP request details."""
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Navigable widgets in DOM order, rebuilt lazily after invalidation
+        self._nav_cache: list[Widget] | None = None
+        self._nav_index: dict[int, int] = {}
+
+    def get_navigable_widgets(self) -> list[Widget]:
+        """Get all navigable descendant widgets in DOM order."""
+        if self._nav_cache is None:
+            # Walk through all descendant widgets in DOM order and filter to navigable types
+            self._nav_cache = [
+                widget for widget in self.walk_children()
+                if isinstance(widget, (Select, NavigableInput, NavigableButton, NavigableTextArea))
+            ]
+            self._nav_index = {id(widget): index for index, widget in enumerate(self._nav_cache)}
+        return self._nav_cache
+
+    def get_navigable_neighbor(self, widget: Widget, delta: int) -> Widget | None:
+        """Get the navigable widget delta positions away from the given one."""
+        focusable = self.get_navigable_widgets()
+        current_index = self._nav_index.get(id(widget))
+        if current_index is None:
+            return None
+        target_index = current_index + delta
+        if 0 <= target_index < len(focusable):
+            return focusable[target_index]
+        return None
+
+    def invalidate_navigation(self) -> None:
+        """Drop the cached navigable widgets after children are added or removed."""
+        self._nav_cache = None
+
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         # Request name input